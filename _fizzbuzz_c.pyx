@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled fast path for FizzBuzz categories.
+
+Optional: fizzbuzz.py uses it when it has been built, and falls back to
+pure NumPy otherwise. Build in place with:
+
+    cythonize -i _fizzbuzz_c.pyx
+"""
+
+from libc.stdint cimport int8_t, int64_t
+from libc.string cimport memcpy
+
+
+# The fundamental pattern, period 15 (same as fizzbuzz.PATTERN)
+cdef int8_t PATTERN[15]
+PATTERN[:] = [0, 0, 1, 0, 2, 1, 0, 0, 1, 2, 0, 1, 0, 0, 3]
+
+
+def fill_categories(int64_t n, int8_t[::1] out):
+    """
+    Fill out[:n] with the categories of 1..n.
+
+    Copies the 15-element pattern once, then keeps doubling the filled
+    prefix (15, 30, 60, ...) with memcpy. Every prefix length is a
+    multiple of 15, so each copy continues the period exactly. Runs
+    without the GIL and allocates nothing.
+    """
+    if out.shape[0] < n:
+        raise ValueError("out must hold at least n elements")
+    if n <= 0:
+        return
+
+    cdef int64_t filled, chunk
+    with nogil:
+        filled = n if n < 15 else 15
+        memcpy(&out[0], PATTERN, filled)
+        while filled < n:
+            chunk = filled if filled < n - filled else n - filled
+            memcpy(&out[filled], &out[0], chunk)
+            filled += chunk
@@ -8,9 +8,29 @@ Demonstrates how different tensor shapes solve different problems:
 - Batched 3D: parallel computation across multiple sequences
 """
 
+import functools
+
 import numpy as np
 
 
+# Decoder shared by every representation: category → output
+DECODER = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
+
+
+@functools.lru_cache(maxsize=4)
+def _arange1(n):
+    """
+    Read-only array [1, ..., n], shared by every representation.
+
+    Comparing representations calls several of them with the same n, so
+    the array is built once and cached.
+    """
+    dtype = np.int32 if n < np.iinfo(np.int32).max else np.int64
+    nums = np.arange(1, n + 1, dtype=dtype)
+    nums.flags.writeable = False
+    return nums
+
+
 # ============================================================================
 # Representation 1: Binary Divisibility Matrix (2×2 - most compressed)
 # ============================================================================
@@ -18,7 +38,7 @@ import numpy as np
 PATTERN_BINARY = np.array([
     [0, 2],  # not div by 3: [number, Buzz]
     [1, 3]   # div by 3:     [Fizz, FizzBuzz]
-])
+], dtype=np.int8)
 
 def fizzbuzz_binary(n):
     """
@@ -27,16 +47,18 @@ def fizzbuzz_binary(n):
     Uses binary divisibility checks to index into 2×2 matrix.
     More computation per lookup, but minimal storage.
     """
-    nums = np.arange(1, n + 1)
-    div_by_3 = (nums % 3 == 0).astype(int)
-    div_by_5 = (nums % 5 == 0).astype(int)
+    nums = _arange1(n)
+    # Reuse the n % 3 buffer for n % 5
+    remainder = nums % 3
+    div_by_3 = np.equal(remainder, 0).view(np.int8)
+    np.remainder(nums, 5, out=remainder)
+    div_by_5 = np.equal(remainder, 0).view(np.int8)
 
     # Index into 2×2 matrix
     categories = PATTERN_BINARY[div_by_3, div_by_5]
 
     # Decode
-    decoder = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
-    result = decoder[categories].copy()
+    result = DECODER[categories]
     result[categories == 0] = nums[categories == 0].astype(str)
 
     return result
@@ -50,7 +72,7 @@ PATTERN_MODULAR = np.array([
     [3, 1, 1, 1, 1],  # n%3==0 (divisible by 3)
     [2, 0, 0, 0, 0],  # n%3==1
     [2, 0, 0, 0, 0]   # n%3==2
-])
+], dtype=np.int8)
 
 def fizzbuzz_modular(n):
     """
@@ -59,11 +81,10 @@ def fizzbuzz_modular(n):
     Each dimension corresponds to one divisor's modular cycle.
     Shows the Cartesian product structure clearly.
     """
-    nums = np.arange(1, n + 1)
+    nums = _arange1(n)
     categories = PATTERN_MODULAR[nums % 3, nums % 5]
 
-    decoder = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
-    result = decoder[categories].copy()
+    result = DECODER[categories]
     result[categories == 0] = nums[categories == 0].astype(str)
 
     return result
@@ -73,20 +94,20 @@ def fizzbuzz_modular(n):
 # Representation 3: Pattern Vector (15-element - from main implementation)
 # ============================================================================
 
-PATTERN_VECTOR = np.array([0, 0, 1, 0, 2, 1, 0, 0, 1, 2, 0, 1, 0, 0, 3])
+PATTERN_VECTOR = np.array([0, 0, 1, 0, 2, 1, 0, 0, 1, 2, 0, 1, 0, 0, 3], dtype=np.int8)
 
 def fizzbuzz_vector(n):
     """
     Sequential pattern: 15 elements.
 
-    Single modulo operation, direct array indexing.
+    The pattern is tiled to length n, so no modulo is needed at all.
     Fastest for sequential access.
     """
-    nums = np.arange(1, n + 1)
-    categories = PATTERN_VECTOR[(nums - 1) % 15]
+    reps = max(n + 14, 0) // 15
+    categories = np.tile(PATTERN_VECTOR, reps)[:n]
 
-    decoder = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
-    result = decoder[categories].copy()
+    result = DECODER[categories]
+    nums = _arange1(n)
     result[categories == 0] = nums[categories == 0].astype(str)
 
     return result
@@ -110,27 +131,23 @@ def fizzbuzz_batched(batch_size, sequence_length):
 
     offsets = np.arange(batch_size)[:, None]  # (batch, 1)
     positions = np.arange(sequence_length)[None, :]  # (1, sequence)
-    nums = offsets * sequence_length + positions + 1  # (batch, sequence)
+    starts = offsets * sequence_length + 1  # (batch, 1)
+    nums = starts + positions  # (batch, sequence)
+
+    # Divisibility masks, one 2D pass per divisor
+    div_by_3 = (nums % 3 == 0)  # (batch, sequence)
+    div_by_5 = (nums % 5 == 0)  # (batch, sequence)
 
-    # Create divisibility tensor
-    divisors = np.array([3, 5])[None, None, :]  # (1, 1, 2)
-    div_matrix = (nums[:, :, None] % divisors == 0).astype(int)  # (batch, sequence, 2)
+    # Encode categories as bits: bit 0 = div by 3, bit 1 = div by 5
+    categories = div_by_3.view(np.uint8) | (div_by_5.view(np.uint8) << 1)  # (batch, sequence)
 
-    # Encode categories
-    powers = np.array([1, 2])[None, None, :]  # (1, 1, 2)
-    categories = (div_matrix * powers).sum(axis=2)  # (batch, sequence)
+    # Stack into the divisibility tensor
+    div_matrix = np.stack([div_by_3, div_by_5], axis=-1).view(np.uint8)  # (batch, sequence, 2)
 
     # Decode to strings
-    decoder = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
-    result = np.empty((batch_size, sequence_length), dtype=object)
-
-    for i in range(batch_size):
-        for j in range(sequence_length):
-            cat = categories[i, j]
-            if cat == 0:
-                result[i, j] = str(nums[i, j])
-            else:
-                result[i, j] = decoder[cat]
+    result = DECODER[categories]
+    number_mask = (categories == 0)
+    result[number_mask] = nums[number_mask].astype(str)
 
     return result, div_matrix
 
@@ -4,16 +4,76 @@ TensorFizzBuzz: The Pattern Vector Approach
 FizzBuzz reduced to its mathematical essence - a repeating pattern of period 15.
 """
 
+import functools
+
 import numpy as np
 
+try:
+    from _fizzbuzz_c import fill_categories
+except ImportError:  # compiled extension is optional (cythonize -i _fizzbuzz_c.pyx)
+    fill_categories = None
+
 
 # The fundamental pattern: the complete solution to FizzBuzz
 # Period = LCM(3, 5) = 15
-PATTERN = np.array([0, 0, 1, 0, 2, 1, 0, 0, 1, 2, 0, 1, 0, 0, 3])
+PATTERN = np.array([0, 0, 1, 0, 2, 1, 0, 0, 1, 2, 0, 1, 0, 0, 3], dtype=np.int8)
 
 # Decoder: category → output
 DECODER = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
 
+# One period of final output: the word slots never change, so only the
+# number slots (NUMBER_MASK_15) need filling in per call
+NUMBER_MASK_15 = (PATTERN == 0)
+PERIOD_STRINGS = DECODER[PATTERN]
+PERIOD_STRINGS[NUMBER_MASK_15] = ""
+
+# Number strings are built once and reused across calls, up to this size
+INT_STR_CACHE_MAX = 1_000_000
+_INT_STR_CACHE = np.array(["0"], dtype=object)
+
+
+def _ensure_cache(n):
+    """Grow the number-string cache so that it covers 0..n."""
+    global _INT_STR_CACHE
+    size = len(_INT_STR_CACHE)
+    if size < n + 1:
+        extra = np.array([str(i) for i in range(size, n + 1)], dtype=object)
+        _INT_STR_CACHE = np.concatenate([_INT_STR_CACHE, extra])
+    return _INT_STR_CACHE
+
+
+def _compiled_kernel(n):
+    """Return the compiled category kernel for an input of size n, or None."""
+    if n <= 0:
+        # Nothing to fill; the NumPy path returns the empty array
+        return None
+    if fill_categories is not None:
+        # Compiled extension: memcpy doubling straight into the output
+        return fill_categories
+    return None
+
+
+def fizzbuzz_categories(n):
+    """
+    Compute FizzBuzz categories for numbers 1 to n, without building strings.
+
+    Use this when only the category signal is needed (analysis, plotting).
+
+    Returns:
+        numpy int8 array of categories (0-3, see fizzbuzz)
+    """
+    kernel = _compiled_kernel(n)
+    if kernel is not None:
+        # Compiled path: one pass straight into the output, no temporaries
+        categories = np.empty(n, dtype=np.int8)
+        kernel(n, categories)
+        return categories
+
+    # Repeat the pattern to cover 1..n (a plain copy, no modulo needed);
+    # clamped so n <= 0 gives an empty array, like np.arange(1, n + 1)
+    reps = max(n + 14, 0) // 15
+    return np.tile(PATTERN, reps)[:n]
+
 
 def fizzbuzz(n):
     """
@@ -28,17 +88,24 @@ def fizzbuzz(n):
     Returns:
         numpy array of strings
     """
-    nums = np.arange(1, n + 1)
-
-    # Map each number to its position in the pattern
-    categories = PATTERN[(nums - 1) % 15]
-
-    # Decode categories to strings
-    result = DECODER[categories].copy()
-
-    # Fill in numbers where category is 0
-    number_mask = (categories == 0)
-    result[number_mask] = nums[number_mask].astype(str)
+    if _compiled_kernel(n) is not None:
+        # Decode compiled categories to strings
+        categories = fizzbuzz_categories(n)
+        result = DECODER[categories]
+        number_mask = (categories == 0)
+    else:
+        # Repeat one period of output to cover 1..n (the string-level
+        # version of fizzbuzz_categories, with no decoding needed)
+        reps = max(n + 14, 0) // 15
+        result = np.tile(PERIOD_STRINGS, reps)[:n]
+        number_mask = np.tile(NUMBER_MASK_15, reps)[:n]
+
+    # Fill in the number slots
+    nums = np.arange(1, n + 1, dtype=np.int64)
+    if n <= INT_STR_CACHE_MAX:
+        result[number_mask] = _ensure_cache(n)[nums[number_mask]]
+    else:
+        result[number_mask] = nums[number_mask].astype(str)
 
     return result
 
@@ -64,6 +131,12 @@ def show_pattern():
     print("This pattern repeats forever!")
 
 
+@functools.lru_cache(maxsize=None)
+def _combo(labels):
+    """Join active labels into one output string, shared across calls."""
+    return "".join(labels) or "{}"
+
+
 def create_pattern(divisors):
     """
     Create a pattern vector for arbitrary divisors.
@@ -79,16 +152,13 @@ def create_pattern(divisors):
     period = np.lcm.reduce(div_values)
 
     # Create pattern for one period
-    nums = np.arange(1, period + 1)[:, None]
-    div_array = np.array(div_values)[None, :]
-
-    # Divisibility matrix: (period, n_divisors)
-    div_matrix = (nums % div_array == 0).astype(int)
+    nums = np.arange(1, period + 1)
 
     # Encode: each combination gets a unique category
-    # Use powers of 2 for binary encoding
-    powers = 2 ** np.arange(len(divisors))
-    pattern = div_matrix @ powers
+    # Bit i is set when the number is divisible by divisor i
+    pattern = np.zeros(period, dtype=np.int32)
+    for i, d in enumerate(div_values):
+        pattern |= (nums % d == 0).astype(np.int32) << i
 
     # Create decoder
     n_categories = 2 ** len(divisors)
@@ -96,9 +166,9 @@ def create_pattern(divisors):
 
     for category in range(n_categories):
         # Decode which divisors are active
-        active = [(category >> i) & 1 for i in range(len(divisors))]
-        labels = [divisors[i][1] for i, a in enumerate(active) if a]
-        decoder[category] = "".join(labels) if labels else "{}"
+        labels = tuple(label for i, (_, label) in enumerate(divisors)
+                       if (category >> i) & 1)
+        decoder[category] = _combo(labels)
 
     return pattern, decoder
 
@@ -122,7 +192,7 @@ if __name__ == "__main__":
 
     nums = np.arange(1, 36)
     categories = pattern_357[(nums - 1) % len(pattern_357)]
-    result = decoder_357[categories].copy()
+    result = decoder_357[categories]
     number_mask = (result == "{}")
     result[number_mask] = nums[number_mask].astype(str)
 
@@ -8,46 +8,101 @@ Shape: (batch_size, sequence_length, n_divisors)
 import numpy as np
 
 
+# Rows of the batch are processed in tiles of about this many bytes of
+# numbers, so the scratch buffers stay resident in L2
+TILE_BYTES = 262144
+
+# Decoder: category → output
+DECODER = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
+
+
 def fizzbuzz_batched(batch_size, sequence_length, offset=0):
     """
     Compute multiple FizzBuzz sequences in parallel using 3D tensors.
 
+    No strings are built here; use format_batched() for printable output.
+
     Args:
         batch_size: Number of sequences to compute
         sequence_length: Length of each sequence
         offset: Starting offset for batch 0 (default: 0 for starting at 1)
 
     Returns:
-        result: (batch, sequence) array of strings
+        categories: (batch, sequence) uint8 bit-packed categories
+        nums: (batch, sequence) int32 number array (int64 when the
+            numbers exceed the int32 range)
         div_tensor: (batch, sequence, 2) divisibility tensor
     """
     # Create batched sequences
     # Batch i starts at: offset + i * sequence_length + 1
-    batch_offsets = np.arange(batch_size)[:, None]  # (batch, 1)
-    positions = np.arange(sequence_length)[None, :]  # (1, sequence)
-    nums = offset + batch_offsets * sequence_length + positions + 1  # (batch, sequence)
-
-    # Create 3D divisibility tensor
-    divisors = np.array([3, 5])[None, None, :]  # (1, 1, 2)
-    div_tensor = (nums[:, :, None] % divisors == 0).astype(int)  # (batch, sequence, 2)
-
-    # Encode categories from divisibility
-    powers = np.array([1, 2])[None, None, :]  # (1, 1, 2)
-    categories = (div_tensor * powers).sum(axis=2)  # (batch, sequence)
+    # int32 halves the bandwidth of the modulo passes (and, being signed,
+    # keeps arithmetic on the returned nums from wrapping); fall back to
+    # int64 when the numbers would not fit
+    limits = np.iinfo(np.int32)
+    count = batch_size * sequence_length
+    if limits.min <= offset + 1 and offset + count <= limits.max and count <= limits.max:
+        dtype = np.int32
+    else:
+        dtype = np.int64
+
+    batch_offsets = np.arange(batch_size, dtype=dtype)[:, None]  # (batch, 1)
+    positions = np.arange(sequence_length, dtype=dtype)[None, :]  # (1, sequence)
+    # Fold the constants into the (batch, 1) column so only one
+    # (batch, sequence) array is allocated by the broadcast
+    starts = batch_offsets * sequence_length + (offset + 1)  # (batch, 1)
+    nums = starts + positions  # (batch, sequence)
+
+    categories = np.empty((batch_size, sequence_length), dtype=np.uint8)
+    div_tensor = np.empty((batch_size, sequence_length, 2), dtype=np.uint8)
+
+    # Scratch buffers reused by every tile, no larger than the input
+    tile_rows = TILE_BYTES // max(1, sequence_length * nums.itemsize)
+    tile = max(1, min(batch_size, tile_rows))
+    remainder = np.empty((tile, sequence_length), dtype=nums.dtype)
+    scratch_3 = np.empty((tile, sequence_length), dtype=bool)
+    scratch_5 = np.empty((tile, sequence_length), dtype=bool)
+
+    for start in range(0, batch_size, tile):
+        stop = min(start + tile, batch_size)
+        rows = stop - start
+        block = nums[start:stop]
+
+        # Divisibility masks for this tile
+        div_by_3 = scratch_3[:rows]
+        div_by_5 = scratch_5[:rows]
+        np.remainder(block, 3, out=remainder[:rows])
+        np.equal(remainder[:rows], 0, out=div_by_3)
+        np.remainder(block, 5, out=remainder[:rows])
+        np.equal(remainder[:rows], 0, out=div_by_5)
+
+        # Encode categories as bits: bit 0 = div by 3, bit 1 = div by 5
+        out = categories[start:stop]
+        np.left_shift(div_by_5.view(np.uint8), 1, out=out)
+        np.bitwise_or(out, div_by_3.view(np.uint8), out=out)
+
+        # Fill this tile's slice of the 3D divisibility tensor
+        div_tensor[start:stop, :, 0] = div_by_3
+        div_tensor[start:stop, :, 1] = div_by_5
+
+    return categories, nums, div_tensor
+
+
+def format_batched(categories, nums):
+    """
+    Decode batched categories to strings.
 
-    # Decode to strings
-    decoder = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
-    result = np.empty((batch_size, sequence_length), dtype=object)
+    Args:
+        categories: (batch, sequence) category array from fizzbuzz_batched
+        nums: (batch, sequence) number array from fizzbuzz_batched
 
-    for i in range(batch_size):
-        for j in range(sequence_length):
-            cat = categories[i, j]
-            if cat == 0:
-                result[i, j] = str(nums[i, j])
-            else:
-                result[i, j] = decoder[cat]
+    Returns:
+        (batch, sequence) array of strings
+    """
+    result = DECODER[categories]
+    number_mask = (categories == 0)
+    result[number_mask] = nums[number_mask].astype(str)
 
-    return result, div_tensor, nums
+    return result
 
 
 def print_batched(result, start_nums):
@@ -85,7 +140,8 @@ if __name__ == "__main__":
     # Demonstrate with small batches
     print("Example: 3 batches of 10 numbers each")
     print("-" * 70)
-    result, div_tensor, nums = fizzbuzz_batched(batch_size=3, sequence_length=10)
+    categories, nums, div_tensor = fizzbuzz_batched(batch_size=3, sequence_length=10)
+    result = format_batched(categories, nums)
 
     print(f"Tensor shape: {div_tensor.shape}")
     print()
@@ -103,7 +159,8 @@ if __name__ == "__main__":
     print("Parallel Computation Example:")
     print("-" * 70)
     print("Computing FizzBuzz for ranges [1-100], [101-200], [201-300]")
-    result, _, nums = fizzbuzz_batched(batch_size=3, sequence_length=100)
+    categories, nums, _ = fizzbuzz_batched(batch_size=3, sequence_length=100)
+    result = format_batched(categories, nums)
 
     print(f"Computed {result.size} values in parallel")
     print(f"Tensor shape: {result.shape}")
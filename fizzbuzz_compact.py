@@ -12,7 +12,7 @@ import numpy as np
 PATTERN_COMPACT = np.array([
     [0, 2],  # not div by 3: [number, Buzz]
     [1, 3]   # div by 3:     [Fizz, FizzBuzz]
-])
+], dtype=np.int8)
 
 # Decoder: category → output
 DECODER = np.array(["{}", "Fizz", "Buzz", "FizzBuzz"], dtype=object)
@@ -32,15 +32,17 @@ def fizzbuzz(n):
     """
     nums = np.arange(1, n + 1)
 
-    # Binary divisibility checks
-    div_by_3 = (nums % 3 == 0).astype(int)
-    div_by_5 = (nums % 5 == 0).astype(int)
+    # Binary divisibility checks, as int8 indices (bool would mask)
+    remainder = nums % 3
+    div_by_3 = np.equal(remainder, 0).view(np.int8)
+    np.remainder(nums, 5, out=remainder)
+    div_by_5 = np.equal(remainder, 0).view(np.int8)
 
     # Index into 2×2 matrix
     categories = PATTERN_COMPACT[div_by_3, div_by_5]
 
     # Decode categories to strings
-    result = DECODER[categories].copy()
+    result = DECODER[categories]
 
     # Fill in numbers where category is 0
     number_mask = (categories == 0)
@@ -0,0 +1,62 @@
+"""
+Shared figure-saving helper for the visualization scripts.
+"""
+
+import os
+
+from PIL import Image
+
+
+# Encoder options per output format. PNG's default zlib level (6) is the
+# slow part of saving; level 1 trades some file size for much faster encoding.
+PIL_KWARGS = {
+    'png': {'compress_level': 1},
+    'jpg': {'quality': 90, 'optimize': False},
+    'jpeg': {'quality': 90, 'optimize': False},
+    'webp': {'quality': 90, 'method': 0},
+}
+
+# Default output resolution for save_figure
+DEFAULT_DPI = 100
+
+
+def _extension(path):
+    """Lower-case file extension of a str or path-like, without the dot."""
+    return os.path.splitext(os.fspath(path))[1].lstrip('.').lower()
+
+
+def save_figure(fig, path, dpi=DEFAULT_DPI, metadata=None):
+    """
+    Lay out and save a figure, choosing encoder options from the extension.
+
+    Args:
+        fig: matplotlib Figure to save
+        path: output path; .png, .jpg/.jpeg and .webp get fast encoder options
+        dpi: output resolution
+        metadata: optional dict of text metadata to embed (PNG only)
+    """
+    ext = _extension(path)
+    fig.tight_layout()
+    # Vector canvases (svg, pdf, eps) reject pil_kwargs, so only pass the
+    # encoder options and metadata to the raster formats that take them
+    kwargs = {}
+    if ext in PIL_KWARGS:
+        kwargs['pil_kwargs'] = PIL_KWARGS[ext]
+    if ext == 'png' and metadata:
+        kwargs['metadata'] = metadata
+    fig.savefig(path, dpi=dpi, **kwargs)
+
+
+def saved_metadata(path, key):
+    """
+    Read a text metadata value from a previously saved PNG.
+
+    Returns None if the file is missing, not a PNG, or lacks the key.
+    """
+    if _extension(path) != 'png' or not os.path.exists(path):
+        return None
+    try:
+        with Image.open(path) as image:
+            return image.info.get(key)
+    except OSError:
+        return None
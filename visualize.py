@@ -4,7 +4,8 @@ Visualize FizzBuzz as a waveform - because why not?
 
 import numpy as np
 import matplotlib.pyplot as plt
-from fizzbuzz import PATTERN, fizzbuzz
+from fizzbuzz import PATTERN, fizzbuzz, fizzbuzz_categories
+from plotting import save_figure
 
 
 def plot_pattern_waveform(periods=5, save_path="fizzbuzz_waveform.png"):
@@ -85,8 +86,7 @@ def plot_pattern_waveform(periods=5, save_path="fizzbuzz_waveform.png"):
     for i in range(periods + 1):
         ax.axvline(x=i * 15 + 0.5, color='cyan', linestyle='--', alpha=0.7, linewidth=1.5)
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    save_figure(fig, save_path, dpi=150)
     print(f"Waveform saved to {save_path}")
 
     return fig
@@ -99,11 +99,11 @@ def plot_frequency_spectrum(n=1000, save_path="fizzbuzz_fft.png"):
     """
 
     # Generate long sequence
-    categories = PATTERN[np.arange(n) % 15]
+    categories = fizzbuzz_categories(n)
 
-    # Compute FFT
-    fft = np.fft.fft(categories)
-    freqs = np.fft.fftfreq(n)
+    # Compute FFT (real input, so only non-negative frequencies are needed)
+    fft = np.fft.rfft(categories.astype(np.float32))
+    freqs = np.fft.rfftfreq(n)
     magnitude = np.abs(fft)
 
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
@@ -119,11 +119,7 @@ def plot_frequency_spectrum(n=1000, save_path="fizzbuzz_fft.png"):
     ax1.grid(True, alpha=0.3)
 
     # Frequency domain
-    # Only plot positive frequencies
-    positive_freqs = freqs[:n//2]
-    positive_magnitude = magnitude[:n//2]
-
-    ax2.stem(positive_freqs[:50], positive_magnitude[:50], linefmt='steelblue',
+    ax2.stem(freqs[:50], magnitude[:50], linefmt='steelblue',
             markerfmt='o', basefmt='gray')
     ax2.set_xlabel('Frequency (cycles per sample)', fontsize=11, fontweight='bold')
     ax2.set_ylabel('Magnitude', fontsize=11, fontweight='bold')
@@ -136,8 +132,7 @@ def plot_frequency_spectrum(n=1000, save_path="fizzbuzz_fft.png"):
                label=f'Fundamental (1/15 ≈ {fundamental:.4f})')
     ax2.legend()
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    save_figure(fig, save_path, dpi=150)
     print(f"Frequency spectrum saved to {save_path}")
 
     return fig
@@ -151,32 +146,21 @@ def plot_2d_heatmap(size=15, save_path="fizzbuzz_2d.png"):
 
     # Create 2D grid
     total = size * size
-    categories = PATTERN[np.arange(total) % 15]
+    categories = fizzbuzz_categories(total)
     grid = categories.reshape(size, size)
 
     fig, ax = plt.subplots(figsize=(10, 10))
 
     im = ax.imshow(grid, cmap='viridis', interpolation='nearest')
 
-    # Add text annotations
-    for i in range(size):
-        for j in range(size):
-            n = i * size + j + 1
-            cat = grid[i, j]
-
-            # Get the output string
-            if cat == 0:
-                text = str(n)
-            elif cat == 1:
-                text = "Fizz"
-            elif cat == 2:
-                text = "Buzz"
-            else:
-                text = "FB"
-
-            color = 'white' if cat >= 2 else 'black'
-            ax.text(j, i, text, ha="center", va="center",
-                   color=color, fontsize=8, fontweight='bold')
+    # Add text annotations (FizzBuzz abbreviated to fit the cell)
+    labels = fizzbuzz(total)
+    labels[categories == 3] = "FB"
+    text_colors = np.where(categories >= 2, 'white', 'black')
+
+    for (i, j), text, color in zip(np.ndindex(size, size), labels, text_colors):
+        ax.text(j, i, text, ha="center", va="center",
+               color=color, fontsize=8, fontweight='bold')
 
     ax.set_title(f'FizzBuzz as a {size}×{size} Texture',
                 fontsize=14, fontweight='bold')
@@ -189,19 +173,22 @@ def plot_2d_heatmap(size=15, save_path="fizzbuzz_2d.png"):
     cbar.set_ticks([0, 1, 2, 3])
     cbar.set_ticklabels(['Number', 'Fizz', 'Buzz', 'FizzBuzz'])
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    save_figure(fig, save_path, dpi=150)
     print(f"2D heatmap saved to {save_path}")
 
     return fig
 
 
 if __name__ == "__main__":
+    plt.switch_backend('Agg')
     print("Generating FizzBuzz visualizations...")
     print("=" * 50)
 
-    plot_pattern_waveform(periods=5)
-    plot_frequency_spectrum(n=1000)
-    plot_2d_heatmap(size=20)
+    fig = plot_pattern_waveform(periods=5)
+    plt.close(fig)
+    fig = plot_frequency_spectrum(n=1000)
+    plt.close(fig)
+    fig = plot_2d_heatmap(size=20)
+    plt.close(fig)
 
     print("\nDone! This was absolutely ridiculous and I loved it.")
@@ -2,9 +2,20 @@
 Visualization for the Compact 2×2 Binary Matrix Approach
 """
 
+import hashlib
+import inspect
+
 import numpy as np
 import matplotlib.pyplot as plt
 from fizzbuzz_compact import PATTERN_COMPACT, DECODER
+from plotting import DEFAULT_DPI, PIL_KWARGS, save_figure, saved_metadata
+
+
+# Cell annotations for the 2×2 matrix are input-independent, so build them once
+_CELL_LABELS = np.empty(PATTERN_COMPACT.shape, dtype=object)
+for (i, j), value in np.ndenumerate(PATTERN_COMPACT):
+    _CELL_LABELS[i, j] = f'{value}\n({DECODER[value] if value > 0 else "Number"})'
+_CELL_COLORS = np.where(PATTERN_COMPACT >= 2, 'white', 'black')
 
 
 def plot_compact_matrix(save_path="docs/images/fizzbuzz_compact.png"):
@@ -18,14 +29,10 @@ def plot_compact_matrix(save_path="docs/images/fizzbuzz_compact.png"):
                     interpolation='nearest')
 
     # Add text annotations
-    for i in range(2):
-        for j in range(2):
-            value = PATTERN_COMPACT[i, j]
-            output = DECODER[value] if value > 0 else "Number"
-            ax1.text(j, i, f'{value}\n({output})',
-                    ha="center", va="center",
-                    color="white" if value >= 2 else "black",
-                    fontsize=14, fontweight='bold')
+    for i, j in np.ndindex(PATTERN_COMPACT.shape):
+        ax1.text(j, i, _CELL_LABELS[i, j],
+                ha="center", va="center", color=_CELL_COLORS[i, j],
+                fontsize=14, fontweight='bold')
 
     ax1.set_xticks([0, 1])
     ax1.set_yticks([0, 1])
@@ -64,17 +71,43 @@ def plot_compact_matrix(save_path="docs/images/fizzbuzz_compact.png"):
             ha='center', fontsize=11, style='italic',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    save_figure(fig, save_path)
     print(f"Compact matrix visualization saved to {save_path}")
 
     return fig
 
 
-def plot_decision_tree(save_path="docs/images/fizzbuzz_decision_tree.png"):
+def _decision_tree_key():
+    """
+    Fingerprint of everything the decision tree figure is drawn and saved from.
+
+    Returns None when the source is unavailable (zipapp, exec'd code), in
+    which case the figure is always re-rendered.
+    """
+    try:
+        source = inspect.getsource(plot_decision_tree)
+    except (OSError, TypeError):
+        return None
+    digest = hashlib.sha256(source.encode())
+    digest.update(f"dpi={DEFAULT_DPI}|png={sorted(PIL_KWARGS['png'].items())}".encode())
+    digest.update(PATTERN_COMPACT.tobytes())
+    digest.update("|".join(DECODER).encode())
+    return digest.hexdigest()
+
+
+def plot_decision_tree(save_path="docs/images/fizzbuzz_decision_tree.png", force=False):
     """
     Visualize the binary decision tree for the compact approach.
+
+    The figure is static, so when save_path already holds a PNG rendered
+    from the same source it is left as is and None is returned. Pass
+    force=True to redraw anyway.
     """
+    key = _decision_tree_key()
+    if not force and key is not None and saved_metadata(save_path, 'SourceHash') == key:
+        print(f"Decision tree visualization up to date at {save_path}")
+        return None
+
     fig, ax = plt.subplots(figsize=(12, 8))
     ax.axis('off')
 
@@ -136,18 +169,21 @@ def plot_decision_tree(save_path="docs/images/fizzbuzz_decision_tree.png"):
            ha='center', fontsize=12, style='italic',
            bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.7))
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    save_figure(fig, save_path, metadata={'SourceHash': key} if key else None)
     print(f"Decision tree visualization saved to {save_path}")
 
     return fig
 
 
 if __name__ == "__main__":
+    plt.switch_backend('Agg')
     print("Generating compact 2×2 matrix visualizations...")
     print("=" * 50)
 
-    plot_compact_matrix()
-    plot_decision_tree()
+    fig = plot_compact_matrix()
+    plt.close(fig)
+    fig = plot_decision_tree()
+    if fig is not None:
+        plt.close(fig)
 
     print("\nDone!")